@@ -5,8 +5,9 @@ This module provides a high-level interface for processing bitemporal timeseries
 data using the underlying Rust implementation.
 """
 import pyarrow as pa
+import pyarrow.compute as pc
 import pandas as pd
-from typing import List, Tuple, Optional, Literal
+from typing import List, Tuple, Optional, Literal, Union
 from datetime import datetime, date
 
 # Import the Rust functions
@@ -26,6 +27,15 @@ SAFE_MAX_TIMESTAMP = pd.Timestamp('2260-12-31 23:59:59')
 # Pandas maximum timestamp (approximately 2262-04-11) - use cautiously
 PANDAS_MAX_TIMESTAMP = pd.Timestamp.max
 
+# Inputs at/after this date are treated as infinity on the way in
+_INPUT_INFINITY_THRESHOLD = pd.Timestamp('9999-01-01')
+
+# Results at/after this date (pandas max range) are restored to INFINITY_TIMESTAMP
+_OUTPUT_INFINITY_THRESHOLD = pd.Timestamp('2262-01-01')
+
+# Maximum number of column/dtype layouts whose inferred Arrow schema is kept per processor
+_SCHEMA_CACHE_SIZE = 32
+
 class BitemporalTimeseriesProcessor:
     """
     A processor for bitemporal timeseries data that efficiently computes
@@ -35,7 +45,13 @@ class BitemporalTimeseriesProcessor:
     (complete replacement of state for given IDs).
     """
     
-    def __init__(self, id_columns: List[str], value_columns: List[str], conflate_inputs: bool = False):
+    def __init__(
+        self,
+        id_columns: List[str],
+        value_columns: List[str],
+        conflate_inputs: bool = False,
+        dtype_backend: Literal["numpy", "pyarrow"] = "numpy"
+    ):
         """
         Initialize the processor with column definitions.
 
@@ -43,15 +59,30 @@ class BitemporalTimeseriesProcessor:
             id_columns: List of column names that identify a unique timeseries
             value_columns: List of column names containing the values to track
             conflate_inputs: Whether to conflate consecutive input updates with same ID and values (default: False)
+            dtype_backend: "numpy" (default) returns NumPy-backed DataFrames; "pyarrow" returns
+                pd.ArrowDtype-backed DataFrames that reference the Arrow buffers without copying
+
+        Raises:
+            ValueError: If dtype_backend is not "numpy" or "pyarrow"
         """
+        if dtype_backend not in ("numpy", "pyarrow"):
+            raise ValueError(f"dtype_backend must be 'numpy' or 'pyarrow', got {dtype_backend!r}")
+
         self.id_columns = id_columns
         self.value_columns = value_columns
         self.conflate_inputs = conflate_inputs
+        self.dtype_backend = dtype_backend
+        self._required_columns = frozenset(
+            id_columns + value_columns + ['effective_from', 'effective_to', 'as_of_from', 'as_of_to']
+        )
+        # Arrow schemas inferred per (column, dtype) layout, reused by _to_record_batch
+        # (bounded by _SCHEMA_CACHE_SIZE; frames with object columns are not cached)
+        self._schema_cache = {}
     
     def compute_changes(
         self,
-        current_state: pd.DataFrame,
-        updates: pd.DataFrame,
+        current_state: Union[pd.DataFrame, pa.RecordBatch, pa.Table],
+        updates: Union[pd.DataFrame, pa.RecordBatch, pa.Table],
         system_date: Optional[str] = None,
         update_mode: Literal["delta", "full_state"] = "delta",
         conflate_inputs: Optional[bool] = None
@@ -59,9 +90,17 @@ class BitemporalTimeseriesProcessor:
         """
         Compute the changes needed to update the bitemporal timeseries.
 
+        Both inputs may also be pyarrow RecordBatches/Tables (e.g. read from parquet).
+        Arrow inputs skip the pandas preparation and from_pandas conversion and go
+        straight to compute_changes_arrow, so they must already be in internal format,
+        except that null effective_to/as_of_to values are treated as open-ended, as
+        they are for DataFrames.
+        An Arrow current state (e.g. from prepare_arrow) can be reused across calls
+        with DataFrame updates; only the updates are prepared on each call.
+
         Args:
-            current_state: DataFrame with current database state
-            updates: DataFrame with incoming updates
+            current_state: DataFrame (or Arrow RecordBatch/Table) with current database state
+            updates: DataFrame (or Arrow RecordBatch/Table) with incoming updates
             system_date: Optional system date (YYYY-MM-DD format)
             update_mode: "delta" for incremental updates, "full_state" for complete state replacement (only expires/inserts when values change)
             conflate_inputs: Whether to conflate consecutive input updates with same ID and values (default: use class-level setting)
@@ -71,26 +110,157 @@ class BitemporalTimeseriesProcessor:
             - rows_to_expire: DataFrame with rows that need as_of_to set
             - rows_to_insert: DataFrame with new rows to insert
         """
-        # Prepare DataFrames for processing
-        current_state = self._prepare_dataframe(current_state)
-        updates = self._prepare_dataframe(updates)
+        arrow_types = (pa.RecordBatch, pa.Table)
+        if isinstance(current_state, arrow_types) and isinstance(updates, arrow_types):
+            # Arrow inputs: no pandas round trip. Nulls (how parquet and Arrow drivers
+            # encode open-ended periods) still become the infinity sentinel, after the
+            # microsecond cast so Date32 effective dates are covered too
+            current_batch = self._replace_infinity_arrow(
+                self._convert_timestamps_to_microseconds(self._as_record_batch(current_state))
+            )
+            updates_batch = self._replace_infinity_arrow(
+                self._convert_timestamps_to_microseconds(self._as_record_batch(updates))
+            )
+        else:
+            # A prepared Arrow side (e.g. current state from prepare_arrow, reused
+            # across update batches) is kept as-is when the DataFrame side lines up
+            current_state, updates = self._prepare_mixed_inputs(current_state, updates)
+            if isinstance(current_state, pa.RecordBatch) and isinstance(updates, pa.RecordBatch):
+                current_batch, updates_batch = current_state, updates
+            else:
+                current_batch = updates_batch = None
+
+        if current_batch is None:
+            # Otherwise any Arrow side falls back to the DataFrame path (a DataFrame side
+            # already prepared by _prepare_mixed_inputs goes through _prepare_dataframe
+            # again, which finds nothing left to convert)
+            if isinstance(current_state, arrow_types):
+                current_state = current_state.to_pandas()
+            if isinstance(updates, arrow_types):
+                updates = updates.to_pandas()
+
+            # Prepare DataFrames for processing
+            current_state = self._prepare_dataframe(current_state)
+            updates = self._prepare_dataframe(updates)
+
+            # Align schemas: reorder columns and validate compatibility
+            current_state, updates = self._align_schemas(current_state, updates)
+
+            # Normalize schemas to ensure timezone consistency between DataFrames
+            current_state, updates = self._normalize_schemas(current_state, updates)
+
+            # Convert pandas DataFrames to Arrow RecordBatches
+            # CRITICAL: preserve_index=False prevents pandas index from leaking into Arrow schema
+            # Without this, some batches get __index_level_0__ column which breaks Rust consolidation
+            current_batch = self._to_record_batch(current_state)
+            updates_batch = self._to_record_batch(updates)
+
+            # Nulls and far-future "infinity" values become SAFE_MAX_TIMESTAMP
+            current_batch = self._replace_infinity_arrow(current_batch)
+            updates_batch = self._replace_infinity_arrow(updates_batch)
+
+        expired_table, insert_table = self.compute_changes_arrow(
+            current_batch,
+            updates_batch,
+            system_date=system_date,
+            update_mode=update_mode,
+            conflate_inputs=conflate_inputs
+        )
 
-        # Align schemas: reorder columns and validate compatibility
-        current_state, updates = self._align_schemas(current_state, updates)
+        # Restore infinity with Arrow compute kernels before any pandas materialisation
+        insert_table = self._restore_infinity_arrow(insert_table)
 
-        # Normalize schemas to ensure timezone consistency between DataFrames
-        current_state, updates = self._normalize_schemas(current_state, updates)
+        if self.dtype_backend == 'pyarrow':
+            # Stay in Arrow for the sort, then wrap the buffers as-is
+            insert_table = insert_table.sort_by('effective_from')
+            rows_to_expire = expired_table.to_pandas(types_mapper=pd.ArrowDtype)
+            rows_to_insert = insert_table.to_pandas(types_mapper=pd.ArrowDtype)
+            return rows_to_expire, rows_to_insert
+
+        # Use expired records from Rust (with updated as_of_to timestamps)
+        if expired_table.num_rows > 0:
+            rows_to_expire = expired_table.to_pandas(split_blocks=True, self_destruct=True)
+        else:
+            rows_to_expire = pd.DataFrame(columns=current_batch.schema.names)
+
+        # as_of_to is now set by Rust layer
+
+        if insert_table.num_rows > 0:
+            rows_to_insert = insert_table.to_pandas(split_blocks=True, self_destruct=True)
+            rows_to_insert = self._convert_from_internal_format(rows_to_insert, infinity_restored=True)
+            # Sort by effective_from for consistent ordering
+            rows_to_insert = rows_to_insert.sort_values(by=['effective_from']).reset_index(drop=True)
+        else:
+            rows_to_insert = pd.DataFrame(columns=current_batch.schema.names)
+
+        return rows_to_expire, rows_to_insert
+
+    def prepare_arrow(self, df: pd.DataFrame) -> pa.RecordBatch:
+        """
+        Convert a DataFrame into the RecordBatch format expected by compute_changes_arrow.
+
+        Applies the same infinity/null handling as compute_changes and converts
+        timestamps to microseconds, so the result can be reused across many
+        compute_changes_arrow calls without repeating the pandas->Arrow work.
+        Column order and timezones are not aligned against another frame; prepare
+        current state and updates with matching schemas.
+
+        Args:
+            df: DataFrame in the same layout accepted by compute_changes
+
+        Returns:
+            RecordBatch ready to pass to compute_changes_arrow
+        """
+        return self._prepared_dataframe_to_arrow(self._prepare_dataframe(df))
+
+    def _prepared_dataframe_to_arrow(self, df: pd.DataFrame) -> pa.RecordBatch:
+        """
+        Arrow half of prepare_arrow, for a DataFrame already run through _prepare_dataframe.
+        """
+        batch = self._to_record_batch(df)
+        batch = self._decode_dictionaries(batch)
+        batch = self._replace_infinity_arrow(batch)
+        return self._convert_timestamps_to_microseconds(batch)
+
+    def compute_changes_arrow(
+        self,
+        current_state: pa.RecordBatch,
+        updates: pa.RecordBatch,
+        system_date: Optional[str] = None,
+        update_mode: Literal["delta", "full_state"] = "delta",
+        conflate_inputs: Optional[bool] = None
+    ) -> Tuple[pa.Table, pa.Table]:
+        """
+        Compute changes directly from Arrow RecordBatches, bypassing pandas.
+
+        Use this when the data already lives in Arrow (parquet, Arrow-native
+        database drivers, or arrays built straight from NumPy buffers) to skip
+        the DataFrame preparation and pandas<->Arrow conversions. Inputs must
+        already be in the processor's internal format: effective/as_of columns
+        as timestamps (or Date32 effective dates), open-ended periods set to
+        INFINITY_TIMESTAMP rather than null, and matching column order and
+        timezones in both batches. Nanosecond timestamps are converted to
+        microseconds as required by the Rust layer. A value_hash column is
+        optional; missing or empty hashes are computed by the Rust layer.
+
+        Args:
+            current_state: RecordBatch with current database state
+            updates: RecordBatch with incoming updates
+            system_date: Optional system date (YYYY-MM-DD format)
+            update_mode: "delta" for incremental updates, "full_state" for complete state replacement
+            conflate_inputs: Whether to conflate consecutive input updates with same ID and values (default: use class-level setting)
+
+        Returns:
+            Tuple of (rows_to_expire, rows_to_insert) as pyarrow Tables
+        """
+        # Decode dictionary columns (e.g. pandas categoricals) - the Rust layer reads plain arrays
+        current_batch = self._decode_dictionaries(current_state)
+        updates_batch = self._decode_dictionaries(updates)
 
-        # Convert pandas DataFrames to Arrow RecordBatches
-        # CRITICAL: preserve_index=False prevents pandas index from leaking into Arrow schema
-        # Without this, some batches get __index_level_0__ column which breaks Rust consolidation
-        current_batch = pa.RecordBatch.from_pandas(current_state, preserve_index=False)
-        updates_batch = pa.RecordBatch.from_pandas(updates, preserve_index=False)
-        
         # Convert timestamp columns from nanoseconds to microseconds for Rust compatibility
         current_batch = self._convert_timestamps_to_microseconds(current_batch)
         updates_batch = self._convert_timestamps_to_microseconds(updates_batch)
-        
+
         # Determine conflate_inputs value (use method parameter if provided, otherwise use class default)
         actual_conflate_inputs = conflate_inputs if conflate_inputs is not None else self.conflate_inputs
 
@@ -105,132 +275,245 @@ class BitemporalTimeseriesProcessor:
             update_mode,
             actual_conflate_inputs
         )
-        
-        # Use expired records from Rust (with updated as_of_to timestamps)
-        # Convert using zero-copy Arrow PyCapsule interface for optimal performance
-        if expired_batch:
-            # Convert arro3 batches to PyArrow via PyCapsule interface (zero-copy)
-            pa_batches = [pa.record_batch(batch) for batch in expired_batch]
-            if pa_batches:
-                table = pa.Table.from_batches(pa_batches)
-                rows_to_expire = table.to_pandas(self_destruct=True)
-            else:
-                rows_to_expire = pd.DataFrame(columns=current_state.columns)
-        else:
-            rows_to_expire = pd.DataFrame(columns=current_state.columns)
-        
+
+        # Convert arro3 batches to PyArrow via PyCapsule interface (zero-copy)
+        rows_to_expire = self._batches_to_table(expired_batch, current_batch.schema)
+        rows_to_insert = self._batches_to_table(insert_batch, updates_batch.schema)
+
         # In full_state mode, adjust effective_to for records that have temporal changes
-        if update_mode == 'full_state' and not rows_to_expire.empty and not updates.empty:
-            # Create a lookup for updates by ID values and effective_from using vectorized operations
-            id_cols = self.id_columns
-
-            # Build lookup using vectorized zip (much faster than iterrows)
-            update_id_keys = list(zip(*[updates[col].values for col in id_cols]))
-            update_eff_from = updates['effective_from'].values
-            update_eff_to = updates['effective_to'].values
-            updates_lookup = {(id_key, eff_from): eff_to
-                             for id_key, eff_from, eff_to in zip(update_id_keys, update_eff_from, update_eff_to)}
-
-            # Build expire keys using vectorized operations
-            expire_id_keys = list(zip(*[rows_to_expire[col].values for col in id_cols]))
-            expire_eff_from = rows_to_expire['effective_from'].values
-
-            # Find matching updates and adjust effective_to
-            eff_to_col_idx = rows_to_expire.columns.get_loc('effective_to')
-            for idx, (id_key, eff_from) in enumerate(zip(expire_id_keys, expire_eff_from)):
-                key = (id_key, eff_from)
-                if key in updates_lookup:
-                    rows_to_expire.iloc[idx, eff_to_col_idx] = updates_lookup[key]
-        
-        # as_of_to is now set by Rust layer
-        
-        # Convert insert batches back to pandas using zero-copy Arrow PyCapsule interface
-        if insert_batch:
-            # Convert arro3 batches to PyArrow via PyCapsule interface (zero-copy)
-            pa_batches = [pa.record_batch(batch) for batch in insert_batch]
-            if pa_batches:
-                table = pa.Table.from_batches(pa_batches)
-                rows_to_insert = table.to_pandas(self_destruct=True)
-            else:
-                rows_to_insert = pd.DataFrame(columns=current_state.columns)
-        else:
-            rows_to_insert = pd.DataFrame(columns=current_state.columns)
-        
-        if not rows_to_insert.empty:
-            rows_to_insert = self._convert_from_internal_format(rows_to_insert)
-            # Sort by effective_from for consistent ordering
-            rows_to_insert = rows_to_insert.sort_values(by=['effective_from']).reset_index(drop=True)
-        
+        if update_mode == 'full_state' and rows_to_expire.num_rows > 0 and updates_batch.num_rows > 0:
+            rows_to_expire = self._adjust_full_state_expiry(rows_to_expire, updates_batch)
+
         return rows_to_expire, rows_to_insert
-    
+
+    def _to_record_batch(self, df: pd.DataFrame) -> pa.RecordBatch:
+        """
+        Convert a prepared DataFrame to a RecordBatch, reusing the schema inferred for
+        the same column/dtype layout on earlier calls so Arrow skips type inference.
+
+        Frames with object columns are never cached: their dtype says nothing about the
+        Python values inside, and a stale schema would silently coerce them (e.g. floats
+        to int64, or Decimals to another scale) and change their value_hash.
+        """
+        if any(dtype == object for dtype in df.dtypes):
+            return pa.RecordBatch.from_pandas(df, preserve_index=False)
+
+        # Dtype objects (not their names) so categories and timezones are part of the key
+        layout = tuple(zip(df.columns, df.dtypes))
+        schema = self._schema_cache.get(layout)
+        if schema is not None:
+            return pa.RecordBatch.from_pandas(df, schema=schema, preserve_index=False)
+
+        batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+        if len(self._schema_cache) >= _SCHEMA_CACHE_SIZE:
+            # Evict the oldest layout (dicts keep insertion order)
+            del self._schema_cache[next(iter(self._schema_cache))]
+        self._schema_cache[layout] = batch.schema
+        return batch
+
+    def _prepare_mixed_inputs(
+        self,
+        current_state: Union[pd.DataFrame, pa.RecordBatch, pa.Table],
+        updates: Union[pd.DataFrame, pa.RecordBatch, pa.Table]
+    ) -> Tuple[Union[pd.DataFrame, pa.RecordBatch, pa.Table], Union[pd.DataFrame, pa.RecordBatch, pa.Table]]:
+        """
+        Pair one Arrow input with a DataFrame without round-tripping the Arrow side through pandas.
+
+        When the DataFrame's columns match the Arrow side, the DataFrame is prepared,
+        converted and reordered to the Arrow side's columns, and both are returned as
+        RecordBatches. Otherwise the inputs come back for the DataFrame path: unchanged
+        when neither is Arrow or the columns differ (checked before any conversion),
+        and with the DataFrame already through _prepare_dataframe when only dtypes or
+        timezones differ, so that work is not repeated.
+        """
+        arrow_types = (pa.RecordBatch, pa.Table)
+        if isinstance(current_state, arrow_types):
+            arrow_input, df = current_state, updates
+        elif isinstance(updates, arrow_types):
+            arrow_input, df = updates, current_state
+        else:
+            return current_state, updates
+
+        # The value_hash placeholder added by _prepare_dataframe is optional for Rust
+        arrow_columns = arrow_input.schema.names
+        df_columns = set(df.columns) | {'value_hash'}
+        if not df_columns.issuperset(arrow_columns) or df_columns - set(arrow_columns) - {'value_hash'}:
+            return current_state, updates
+
+        df = self._prepare_dataframe(df)
+        prepared = self._prepared_dataframe_to_arrow(df)
+        prepared = self._as_record_batch(pa.Table.from_batches([prepared]).select(arrow_columns))
+        # Nulls on the Arrow side mean open-ended, as on the DataFrame side
+        arrow_batch = self._replace_infinity_arrow(self._convert_timestamps_to_microseconds(
+            self._decode_dictionaries(self._as_record_batch(arrow_input))
+        ))
+
+        if not prepared.schema.equals(arrow_batch.schema):
+            # Dtype/timezone differences are reconciled on the DataFrame path
+            arrow_batch = arrow_input
+            prepared = df
+
+        if arrow_input is current_state:
+            return arrow_batch, prepared
+        return prepared, arrow_batch
+
+    @staticmethod
+    def _as_record_batch(data: Union[pa.RecordBatch, pa.Table]) -> pa.RecordBatch:
+        """
+        Return Arrow input as a single RecordBatch (Tables are combined into one chunk).
+        """
+        if isinstance(data, pa.RecordBatch):
+            return data
+        return pa.RecordBatch.from_arrays(
+            [column.combine_chunks() for column in data.columns],
+            schema=data.schema
+        )
+
+    @staticmethod
+    def _decode_dictionaries(batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Decode dictionary-encoded columns back to their value type.
+
+        Categorical columns cross the pandas->Arrow boundary as compact dictionary
+        arrays; expanding them here happens entirely inside Arrow.
+        """
+        if not any(pa.types.is_dictionary(field.type) for field in batch.schema):
+            return batch
+
+        columns = []
+        fields = []
+        for field, column in zip(batch.schema, batch.columns):
+            if pa.types.is_dictionary(field.type):
+                column = column.dictionary_decode()
+                field = pa.field(field.name, column.type, field.nullable)
+            columns.append(column)
+            fields.append(field)
+
+        return pa.RecordBatch.from_arrays(columns, schema=pa.schema(fields))
+
+    @staticmethod
+    def _batches_to_table(batches: list, schema: pa.Schema) -> pa.Table:
+        """
+        Combine the arro3 batches returned by Rust into a single pyarrow Table.
+        """
+        if not batches:
+            return schema.empty_table()
+        return pa.Table.from_batches([pa.record_batch(batch) for batch in batches])
+
+    def _adjust_full_state_expiry(self, rows_to_expire: pa.Table, updates: pa.RecordBatch) -> pa.Table:
+        """
+        Carry an update's effective_to onto expired rows that share its ID values
+        and effective_from (full_state mode only).
+        """
+        key_columns = self.id_columns + ['effective_from']
+        updates_table = pa.Table.from_batches([updates])
+
+        # Index updates by key; the last update wins for duplicate keys
+        update_keys = pd.MultiIndex.from_arrays([updates_table.column(col).to_numpy() for col in key_columns])
+        update_effective_to = updates_table.column('effective_to').to_numpy()
+        unique_keys = ~update_keys.duplicated(keep='last')
+        update_keys = update_keys[unique_keys]
+        update_effective_to = update_effective_to[unique_keys]
+
+        # Match expired rows to updates in one vectorized lookup and adjust effective_to
+        expire_keys = pd.MultiIndex.from_arrays([rows_to_expire.column(col).to_numpy() for col in key_columns])
+        positions = update_keys.get_indexer(expire_keys)
+        matched = positions >= 0
+        if not matched.any():
+            return rows_to_expire
+
+        adjusted = rows_to_expire.column('effective_to').to_numpy().copy()
+        adjusted[matched] = update_effective_to[positions[matched]]
+
+        eff_to_idx = rows_to_expire.schema.get_field_index('effective_to')
+        eff_to_field = rows_to_expire.schema.field(eff_to_idx)
+        return rows_to_expire.set_column(eff_to_idx, eff_to_field, pa.array(adjusted, type=eff_to_field.type, from_pandas=True))
+
     def _prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Prepare DataFrame for processing by converting infinity dates.
+        Prepare DataFrame for processing by converting temporal columns to datetimes.
+
+        Infinity/null handling happens after conversion to Arrow (_replace_infinity_arrow).
         """
-        df = df.copy()
-        
-        # Convert infinity to pandas max timestamp for internal processing
-        effective_date_columns = ['effective_from', 'effective_to']
-        as_of_timestamp_columns = ['as_of_from', 'as_of_to']
+        # Shallow copy: only temporal columns are rewritten (by replacement), so
+        # value columns are shared with the caller's frame instead of duplicated
+        df = df.copy(deep=False)
         
-        # Handle effective date columns (convert to dates)
-        for col in effective_date_columns:
+        for col in ['effective_from', 'effective_to', 'as_of_from', 'as_of_to']:
             if col in df.columns:
                 # Only convert to datetime if not already a datetime type (preserve timezone info)
                 if not pd.api.types.is_datetime64_any_dtype(df[col]):
                     df[col] = pd.to_datetime(df[col])
-                
-                # Handle null values and infinity replacement with timezone awareness
-                fill_value = SAFE_MAX_TIMESTAMP
-                infinity_threshold = pd.Timestamp('9999-01-01')
-                replacement_value = SAFE_MAX_TIMESTAMP
-                
-                if (hasattr(df[col].dtype, 'tz') and df[col].dtype.tz is not None) or \
-                   (hasattr(df[col], 'dt') and df[col].dt.tz is not None):
-                    # Column is timezone-aware, make all values timezone-aware too
-                    col_tz = getattr(df[col].dtype, 'tz', None) or df[col].dt.tz
-                    fill_value = fill_value.tz_localize(col_tz)
-                    infinity_threshold = infinity_threshold.tz_localize(col_tz)
-                    replacement_value = replacement_value.tz_localize(col_tz)
-                
-                # Replace null with pandas max timestamp
-                df[col] = df[col].fillna(fill_value)
-                df.loc[df[col] >= infinity_threshold, col] = replacement_value
-                
-                # Keep as timestamp for processing (timestamp precision)
-        
-        # Handle as_of timestamp columns (preserve timestamp precision)
-        for col in as_of_timestamp_columns:
-            if col in df.columns:
-                # Only convert to datetime if not already a datetime type (preserve timezone info)
-                if not pd.api.types.is_datetime64_any_dtype(df[col]):
-                    df[col] = pd.to_datetime(df[col])
-                
-                # Handle null values and infinity replacement with timezone awareness
-                fill_value = SAFE_MAX_TIMESTAMP
-                infinity_threshold = pd.Timestamp('9999-01-01')
-                replacement_value = SAFE_MAX_TIMESTAMP
-                
-                if (hasattr(df[col].dtype, 'tz') and df[col].dtype.tz is not None) or \
-                   (hasattr(df[col], 'dt') and df[col].dt.tz is not None):
-                    # Column is timezone-aware, make all values timezone-aware too
-                    col_tz = getattr(df[col].dtype, 'tz', None) or df[col].dt.tz
-                    fill_value = fill_value.tz_localize(col_tz)
-                    infinity_threshold = infinity_threshold.tz_localize(col_tz)
-                    replacement_value = replacement_value.tz_localize(col_tz)
-                
-                # Replace null with pandas max timestamp
-                df[col] = df[col].fillna(fill_value)
-                df.loc[df[col] >= infinity_threshold, col] = replacement_value
-                
-                # Keep as timestamp for microsecond precision
-                # Note: pandas uses nanosecond precision, which is compatible with Arrow timestamp[ns]
+                df[col] = self._as_microseconds(df[col])
         
         # Add value_hash column if it doesn't exist (it will be computed by Rust)
+        # Typed (not object) so the placeholder alone doesn't keep the frame out of the
+        # schema cache; python storage converts to plain Arrow utf8, which Rust expects
         if 'value_hash' not in df.columns:
-            df['value_hash'] = ""  # Placeholder, will be computed by Rust
+            df['value_hash'] = pd.Series("", index=df.index, dtype=pd.StringDtype("python"))
         
         return df
+
+    @staticmethod
+    def _as_microseconds(series: pd.Series) -> pd.Series:
+        """
+        Downcast a NumPy-backed datetime column to microseconds (truncating sub-microsecond
+        values), so from_pandas already yields the timestamp[us] the Rust layer expects and
+        _convert_timestamps_to_microseconds has nothing left to cast.
+        """
+        if isinstance(series.dtype, pd.ArrowDtype) or series.dt.unit == 'us':
+            return series
+        return series.dt.as_unit('us')
+
+    @staticmethod
+    def _replace_infinity_arrow(batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Replace nulls and values at/after 9999-01-01 in the temporal columns with
+        SAFE_MAX_TIMESTAMP using pyarrow.compute (timezone-aware columns get a
+        sentinel in their own timezone).
+        """
+        columns = list(batch.columns)
+        changed = False
+        for col in ['effective_from', 'effective_to', 'as_of_from', 'as_of_to']:
+            col_idx = batch.schema.get_field_index(col)
+            if col_idx < 0 or not pa.types.is_timestamp(batch.schema.field(col_idx).type):
+                continue
+            field = batch.schema.field(col_idx)
+            column = columns[col_idx]
+
+            replacement_value = SAFE_MAX_TIMESTAMP
+            infinity_threshold = _INPUT_INFINITY_THRESHOLD
+            col_tz = getattr(field.type, 'tz', None)
+            if col_tz is not None:
+                replacement_value = replacement_value.tz_localize(col_tz)
+                infinity_threshold = infinity_threshold.tz_localize(col_tz)
+            replacement = pa.scalar(replacement_value, type=field.type)
+
+            if field.type.unit == 'ns':
+                # Nanosecond timestamps end in 2262, so only nulls can mean infinity
+                if column.null_count == 0:
+                    continue
+                column = pc.fill_null(column, replacement)
+            else:
+                threshold = pa.scalar(infinity_threshold, type=field.type)
+                # Already-clean columns (e.g. from a previous result) need one max
+                # reduction instead of building and scanning a full mask
+                if column.null_count == 0:
+                    column_max = pc.max(column)
+                    if not column_max.is_valid or pc.less(column_max, threshold).as_py():
+                        continue
+                # Nulls count as infinity, so the comparison mask fills them with True
+                infinity_mask = pc.fill_null(pc.greater_equal(column, threshold), True)
+                if not pc.any(infinity_mask).as_py():
+                    continue
+                column = pc.if_else(infinity_mask, replacement, column)
+
+            columns[col_idx] = column
+            changed = True
+
+        if not changed:
+            return batch
+        return pa.RecordBatch.from_arrays(columns, schema=batch.schema)
     
     def _align_schemas(self, current_state: pd.DataFrame, updates: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
@@ -264,8 +547,10 @@ class BitemporalTimeseriesProcessor:
         This prevents Arrow schema mismatches when one DataFrame has timezone-aware columns
         and the other has timezone-naive columns.
         """
-        current_state = current_state.copy()
-        updates = updates.copy()
+        # Shallow copies: columns are only ever replaced, never written in place,
+        # so the caller's frames stay untouched without duplicating every block
+        current_state = current_state.copy(deep=False)
+        updates = updates.copy(deep=False)
         
         timestamp_columns = ['effective_from', 'effective_to', 'as_of_from', 'as_of_to']
         
@@ -307,88 +592,72 @@ class BitemporalTimeseriesProcessor:
         """
         Convert timestamp columns to microseconds for Rust compatibility.
         Also convert effective_from/effective_to from Date32 to Timestamp.
+
+        The target schema is resolved once up front; batches that are already in
+        microseconds (e.g. from prepare_arrow) are returned unchanged.
         """
         schema = batch.schema
+        target_fields = [self._microsecond_field(field) for field in schema]
+
+        if all(field.type.equals(target.type) for field, target in zip(schema, target_fields)):
+            return batch
+
         columns = []
-        
-        for i, field in enumerate(schema):
-            column = batch.column(i)
-            
-            # Convert as_of timestamp columns from ns to us
-            if field.name in ['as_of_from', 'as_of_to'] and pa.types.is_timestamp(field.type):
-                if field.type.unit == 'ns':
-                    # Preserve timezone information during conversion
-                    target_type = pa.timestamp('us', tz=field.type.tz)
-                    # Handle pandas max timestamp which is too large for microseconds
-                    # Cast with safe conversion that truncates nanoseconds
-                    try:
-                        column = column.cast(target_type)
-                    except pa.ArrowInvalid:
-                        # If casting fails due to overflow, manually convert
-                        # This happens with pd.Timestamp.max
-                        np_array = column.to_pandas().values
-                        # Convert to microseconds by dividing nanoseconds by 1000
-                        us_values = np_array.astype('datetime64[us]')
-                        column = pa.array(us_values, type=target_type)
-            
-            # Convert effective timestamp columns from ns to us
-            elif field.name in ['effective_from', 'effective_to'] and pa.types.is_timestamp(field.type):
-                if field.type.unit == 'ns':
-                    # Preserve timezone information during conversion
-                    target_type = pa.timestamp('us', tz=field.type.tz)
-                    # Convert nanosecond timestamps to microsecond timestamps
-                    try:
-                        column = column.cast(target_type)
-                    except pa.ArrowInvalid:
-                        # If casting fails due to overflow, manually convert
-                        np_array = column.to_pandas().values
-                        us_values = np_array.astype('datetime64[us]')
-                        column = pa.array(us_values, type=target_type)
-            
-            # Convert effective date columns from Date32 to Timestamp  
-            elif field.name in ['effective_from', 'effective_to'] and pa.types.is_date32(field.type):
-                # Convert Date32 to Timestamp (midnight for date-only values)
-                pandas_series = column.to_pandas()
-                timestamp_series = pd.to_datetime(pandas_series)
-                column = pa.array(timestamp_series, type=pa.timestamp('us'))
-            
+        for field, target, column in zip(schema, target_fields, batch.columns):
+            if field.type.equals(target.type):
+                columns.append(column)
+                continue
+
+            # Arrow casts Date32 to Timestamp (midnight) and ns to us directly on the
+            # buffers, preserving timezone information
+            try:
+                column = column.cast(target.type)
+            except pa.ArrowInvalid:
+                # If casting fails (e.g. pd.Timestamp.max or sub-microsecond values),
+                # truncate to microseconds via numpy
+                np_array = column.to_pandas().values
+                us_values = np_array.astype('datetime64[us]')
+                column = pa.array(us_values, type=target.type)
             columns.append(column)
-        
-        # Create new schema with updated timestamp types (preserving timezone info)
-        new_fields = []
-        for field in schema:
-            if field.name in ['as_of_from', 'as_of_to', 'effective_from', 'effective_to'] and pa.types.is_timestamp(field.type):
-                # Preserve timezone information when updating to microseconds
-                new_fields.append(pa.field(field.name, pa.timestamp('us', tz=field.type.tz), field.nullable))
-            elif field.name in ['effective_from', 'effective_to'] and pa.types.is_date32(field.type):
-                # Date32 columns don't have timezone, so use None
-                new_fields.append(pa.field(field.name, pa.timestamp('us'), field.nullable))
-            else:
-                new_fields.append(field)
-        
-        new_schema = pa.schema(new_fields)
-        return pa.RecordBatch.from_arrays(columns, schema=new_schema)
-    
-    def _convert_from_internal_format(self, df: pd.DataFrame) -> pd.DataFrame:
+
+        return pa.RecordBatch.from_arrays(columns, schema=pa.schema(target_fields))
+
+    @staticmethod
+    def _microsecond_field(field: pa.Field) -> pa.Field:
+        """
+        Target field for the Rust layer: temporal columns as timestamp[us] (keeping tz).
+        """
+        if field.name in ['as_of_from', 'as_of_to', 'effective_from', 'effective_to'] and pa.types.is_timestamp(field.type):
+            return pa.field(field.name, pa.timestamp('us', tz=field.type.tz), field.nullable)
+        if field.name in ['effective_from', 'effective_to'] and pa.types.is_date32(field.type):
+            # Date32 columns don't have timezone, so use None
+            return pa.field(field.name, pa.timestamp('us'), field.nullable)
+        return field
+
+    def _convert_from_internal_format(self, df: pd.DataFrame, infinity_restored: bool = False) -> pd.DataFrame:
         """
         Convert from internal format back to external format.
+
+        With infinity_restored=True (results already through _restore_infinity_arrow),
+        datetime columns skip the pandas-side infinity restore.
         """
-        df = df.copy()
+        # Shallow copy: columns below are only ever replaced, never modified in place
+        df = df.copy(deep=False)
         
         # Convert dates back to timestamps - handle effective and as_of columns differently
         effective_date_columns = ['effective_from', 'effective_to']
         as_of_timestamp_columns = ['as_of_from', 'as_of_to']
 
         # Convert effective date columns - force datetime.date objects to datetime
-        # Use vectorized pd.to_datetime() instead of slow .apply() per element
+        # Columns that are already datetime64 (the normal Arrow output) are left as-is
         for col in effective_date_columns:
-            if col in df.columns:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
                 # pd.to_datetime handles both date objects and timestamps correctly
                 df[col] = pd.to_datetime(df[col])
         
         # Convert as_of timestamp columns more carefully to preserve precision
         for col in as_of_timestamp_columns:
-            if col in df.columns:
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
                 try:
                     df[col] = pd.to_datetime(df[col])
                 except (pd.errors.OutOfBoundsDatetime, OverflowError):
@@ -399,57 +668,90 @@ class BitemporalTimeseriesProcessor:
         unbounded_columns = ['effective_to', 'as_of_to']
         for col in unbounded_columns:
             if col in df.columns:
+                if infinity_restored and pd.api.types.is_datetime64_any_dtype(df[col]):
+                    # Already restored in Arrow; a second scan would find nothing
+                    continue
                 # Handle dates that are beyond pandas range or at the max value
                 try:
                     # First, check if we already have datetime values
                     if not pd.api.types.is_datetime64_any_dtype(df[col]):
                         df[col] = pd.to_datetime(df[col], errors='coerce')
                     
-                    # Create mask for infinity detection:
-                    # 1. NaT values (result of overflow during conversion)
-                    # 2. Dates beyond 2262 (near pandas max)
-                    # 3. Dates exactly equal to pandas max
-                    is_nat_mask = pd.isna(df[col])
-                    is_large_date_mask = df[col].dt.year >= 2262
-                    
-                    # Create timezone-aware comparison timestamp if needed
-                    max_timestamp_threshold = pd.Timestamp('2262-04-01')
-                    if (hasattr(df[col].dtype, 'tz') and df[col].dtype.tz is not None) or \
-                       (hasattr(df[col], 'dt') and df[col].dt.tz is not None):
-                        col_tz = getattr(df[col].dtype, 'tz', None) or df[col].dt.tz
-                        max_timestamp_threshold = max_timestamp_threshold.tz_localize(col_tz)
-                    
-                    is_max_timestamp_mask = df[col] >= max_timestamp_threshold
-                    
-                    infinity_mask = is_nat_mask | is_large_date_mask | is_max_timestamp_mask
-                    
-                    if infinity_mask.any():
-                        # Replace infinity values with infinity date
-                        infinity_replacement = INFINITY_TIMESTAMP
-                        if (hasattr(df[col].dtype, 'tz') and df[col].dtype.tz is not None) or \
-                           (hasattr(df[col], 'dt') and df[col].dt.tz is not None):
-                            col_tz = getattr(df[col].dtype, 'tz', None) or df[col].dt.tz
-                            infinity_replacement = infinity_replacement.tz_localize(col_tz)
-                        df.loc[infinity_mask, col] = infinity_replacement
+                    df[col] = self._restore_infinity(df[col])
                         
                 except (pd.errors.OutOfBoundsDatetime, OverflowError, AttributeError):
                     # If any conversion fails due to overflow, assume entire column needs infinity
                     infinity_replacement = INFINITY_TIMESTAMP
-                    if (hasattr(df[col].dtype, 'tz') and df[col].dtype.tz is not None) or \
-                       (hasattr(df[col], 'dt') and df[col].dt.tz is not None):
-                        col_tz = getattr(df[col].dtype, 'tz', None) or df[col].dt.tz
+                    col_tz = getattr(df[col].dtype, 'tz', None)
+                    if col_tz is not None:
                         infinity_replacement = infinity_replacement.tz_localize(col_tz)
                     df[col] = infinity_replacement
         
         return df
+
+    @staticmethod
+    def _restore_infinity(series: pd.Series) -> pd.Series:
+        """
+        Replace NaT (overflow) and dates in 2262 or later (pandas max range) with
+        INFINITY_TIMESTAMP using a single comparison and masked assign.
+        """
+        infinity_replacement = INFINITY_TIMESTAMP
+        max_timestamp_threshold = _OUTPUT_INFINITY_THRESHOLD
+        
+        col_tz = getattr(series.dtype, 'tz', None)
+        if col_tz is not None:
+            infinity_replacement = infinity_replacement.tz_localize(col_tz)
+            max_timestamp_threshold = max_timestamp_threshold.tz_localize(col_tz)
+        
+        # One threshold comparison covers both "year >= 2262" and "near pandas max"
+        infinity_mask = series.isna() | (series >= max_timestamp_threshold)
+        if not infinity_mask.any():
+            return series
+        return series.mask(infinity_mask, infinity_replacement)
     
+    @staticmethod
+    def _restore_infinity_arrow(table: pa.Table) -> pa.Table:
+        """
+        Arrow counterpart of _restore_infinity (pyarrow.compute if_else over a mask).
+
+        Applied to insert results before conversion, so _convert_from_internal_format
+        can skip its pandas-side restore for them.
+        """
+        for col in ['effective_to', 'as_of_to']:
+            col_idx = table.schema.get_field_index(col)
+            if col_idx < 0 or not pa.types.is_timestamp(table.schema.field(col_idx).type):
+                continue
+            field = table.schema.field(col_idx)
+            column = table.column(col_idx)
+
+            infinity_replacement = INFINITY_TIMESTAMP
+            max_timestamp_threshold = _OUTPUT_INFINITY_THRESHOLD
+            col_tz = getattr(field.type, 'tz', None)
+            if col_tz is not None:
+                infinity_replacement = infinity_replacement.tz_localize(col_tz)
+                max_timestamp_threshold = max_timestamp_threshold.tz_localize(col_tz)
+
+            threshold = pa.scalar(max_timestamp_threshold, type=field.type)
+            # Columns with nothing to restore need one max reduction instead of a
+            # full mask plus if_else copy (same early exit as _replace_infinity_arrow)
+            if column.null_count == 0:
+                column_max = pc.max(column)
+                if not column_max.is_valid or pc.less(column_max, threshold).as_py():
+                    continue
+
+            # Nulls count as infinity, matching NaT handling in the pandas path
+            infinity_mask = pc.fill_null(pc.greater_equal(column, threshold), True)
+            if not pc.any(infinity_mask).as_py():
+                continue
+            restored = pc.if_else(infinity_mask, pa.scalar(infinity_replacement, type=field.type), column)
+            table = table.set_column(col_idx, field, restored)
+        return table
+
     def validate_schema(self, df: pd.DataFrame) -> bool:
         """
         Validate that a DataFrame has the required schema.
         """
-        required_cols = set(self.id_columns + self.value_columns + 
-                           ['effective_from', 'effective_to', 'as_of_from', 'as_of_to'])
-        return required_cols.issubset(set(df.columns))
+        return self._required_columns.issubset(df.columns)
 
 
 def add_hash_key(df: pd.DataFrame, value_fields: List[str], hash_algorithm: str = 'xxhash') -> pd.DataFrame:
@@ -497,15 +799,21 @@ def add_hash_key(df: pd.DataFrame, value_fields: List[str], hash_algorithm: str
     if missing_cols:
         raise ValueError(f"Value fields not found in DataFrame: {missing_cols}")
 
-    # Convert to Arrow RecordBatch (preserve_index=False prevents schema issues)
-    record_batch = pa.RecordBatch.from_pandas(df, preserve_index=False)
+    # Only the hashed columns need to cross into Arrow (the whole frame when there are
+    # none, so the batch still carries the row count); preserve_index=False prevents
+    # schema issues
+    hash_input = df[list(dict.fromkeys(value_fields))] if value_fields else df
+    record_batch = pa.RecordBatch.from_pandas(hash_input, preserve_index=False)
 
     # Call the Rust function with the specified algorithm
     result_batch = _add_hash_key_with_algorithm(record_batch, value_fields, hash_algorithm)
 
-    # Convert back to pandas using zero-copy Arrow PyCapsule interface
-    pa_batch = pa.record_batch(result_batch)
-    result_df = pa_batch.to_pandas()
+    # Import via the Arrow PyCapsule interface and attach just the hash column to a
+    # shallow copy, instead of round-tripping every column through Arrow and back
+    hash_column = pa.record_batch(result_batch).column('value_hash')
+    result_df = df.copy(deep=False)
+    result_df.index = pd.RangeIndex(len(result_df))
+    result_df['value_hash'] = hash_column.to_numpy(zero_copy_only=False)
 
     return result_df
 
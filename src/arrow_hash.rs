@@ -5,8 +5,16 @@ use arrow::array::{Float32Array, Float64Array, BooleanArray};
 use arrow::array::{Date32Array, Date64Array, Decimal128Array};
 use arrow::array::{TimestampSecondArray, TimestampMillisecondArray, TimestampMicrosecondArray, TimestampNanosecondArray};
 use arrow::datatypes::DataType;
+use rayon::prelude::*;
 use std::sync::Arc;
 
+/// Batches with more rows than this are hashed on the rayon pool (same cut-off as
+/// process_all_id_groups); smaller ones stay on the calling thread with no rayon overhead
+const PARALLEL_HASH_MIN_ROWS: usize = 5000;
+
+/// Rows hashed per parallel task once a batch is above PARALLEL_HASH_MIN_ROWS
+const PARALLEL_HASH_CHUNK_ROWS: usize = 4096;
+
 /// Fast hash computation directly on Arrow arrays without deserialization
 pub fn hash_values_batch_arrow_direct(
     record_batch: &RecordBatch, 
@@ -14,8 +22,6 @@ pub fn hash_values_batch_arrow_direct(
     value_columns: &[String],
     algorithm: HashAlgorithm,
 ) -> Vec<String> {
-    let mut hashes = Vec::with_capacity(row_indices.len());
-    
     // Pre-compute column indices and arrays to avoid repeated lookups
     let col_data: Vec<(&str, &ArrayRef)> = value_columns.iter()
         .map(|col_name| {
@@ -24,11 +30,29 @@ pub fn hash_values_batch_arrow_direct(
         })
         .collect();
     
+    if row_indices.len() <= PARALLEL_HASH_MIN_ROWS {
+        return hash_rows(&col_data, row_indices, algorithm);
+    }
+    
+    // Rows hash independently, so large batches are split across the rayon pool;
+    // collect keeps the chunks (and therefore the hashes) in row order
+    row_indices
+        .par_chunks(PARALLEL_HASH_CHUNK_ROWS)
+        .flat_map_iter(|chunk| hash_rows(&col_data, chunk, algorithm))
+        .collect()
+}
+
+/// Hash the given rows sequentially, reusing one input buffer across rows
+fn hash_rows(col_data: &[(&str, &ArrayRef)], row_indices: &[usize], algorithm: HashAlgorithm) -> Vec<String> {
+    let mut hashes = Vec::with_capacity(row_indices.len());
+    let mut hasher_input = Vec::with_capacity(1024); // Pre-allocate reasonable buffer
+    
     for &row_idx in row_indices {
-        let mut hasher_input = Vec::with_capacity(1024); // Pre-allocate reasonable buffer
+        // Cleared rather than reallocated: keeps the capacity from previous rows
+        hasher_input.clear();
         
         // Hash each column's raw bytes directly without conversion to ScalarValue
-        for (_col_name, array) in &col_data {
+        for (_col_name, array) in col_data {
             hash_array_value_direct(array, row_idx, &mut hasher_input);
         }
         
@@ -577,6 +577,10 @@ pub fn conflate_input_updates(updates: RecordBatch, id_columns: &[String]) -> Re
         .map_err(|e| format!("Failed to create conflated RecordBatch: {}", e))
 }
 
+/// Target rows per consolidated output batch: 8192 rows keeps a few 8-byte columns
+/// (~64KB each) within a core's L2 cache while amortising per-batch FFI overhead
+const CONSOLIDATED_BATCH_ROWS: usize = 8192;
+
 /// Consolidate multiple RecordBatches into fewer large batches to reduce Python conversion overhead
 /// This combines smaller batches from different ID groups into larger consolidated batches
 pub fn consolidate_final_batches(batches: Vec<RecordBatch>) -> Result<Vec<RecordBatch>, String> {
@@ -615,9 +619,9 @@ pub fn consolidate_final_batches(batches: Vec<RecordBatch>) -> Result<Vec<Record
     let table = arrow::compute::concat_batches(&Arc::new(unified_schema), &unified_batches)
         .map_err(|e| format!("Failed to consolidate batches: {}", e))?;
     
-    // Split the consolidated data into reasonably-sized batches (target ~10k rows per batch)
+    // Split the consolidated data into cache-friendly batches (see CONSOLIDATED_BATCH_ROWS)
     let mut result_batches = Vec::new();
-    let target_batch_size = 10000;
+    let target_batch_size = CONSOLIDATED_BATCH_ROWS;
     let total_rows = table.num_rows();
     
     if total_rows <= target_batch_size {
@@ -227,15 +227,22 @@ fn build_id_groups(
     // Group current state rows by ID key
     for row_idx in 0..current_state.num_rows() {
         create_id_key_with_buffer(&current_id_arrays, row_idx, &mut id_key_buffer);
-        let id_key = id_key_buffer.clone(); // TODO: Could optimize further with string interning
-        id_groups.entry(id_key).or_insert((Vec::new(), Vec::new())).0.push(row_idx);
+        // Look up by &str first so the key is only allocated once per distinct ID
+        if let Some(group) = id_groups.get_mut(id_key_buffer.as_str()) {
+            group.0.push(row_idx);
+        } else {
+            id_groups.insert(id_key_buffer.clone(), (vec![row_idx], Vec::new()));
+        }
     }
     
     // Group update rows by ID key  
     for row_idx in 0..updates.num_rows() {
         create_id_key_with_buffer(&updates_id_arrays, row_idx, &mut id_key_buffer);
-        let id_key = id_key_buffer.clone(); // TODO: Could optimize further with string interning
-        id_groups.entry(id_key).or_insert((Vec::new(), Vec::new())).1.push(row_idx);
+        if let Some(group) = id_groups.get_mut(id_key_buffer.as_str()) {
+            group.1.push(row_idx);
+        } else {
+            id_groups.insert(id_key_buffer.clone(), (Vec::new(), vec![row_idx]));
+        }
     }
     
     Ok(id_groups)
@@ -1186,6 +1193,7 @@ fn create_id_key_with_buffer(id_arrays: &[arrow::array::ArrayRef], row_idx: usiz
 
 #[pyfunction]
 fn compute_changes(
+    py: Python<'_>,
     current_state: PyRecordBatch,
     updates: PyRecordBatch,
     id_columns: Vec<String>,
@@ -1194,11 +1202,12 @@ fn compute_changes(
     update_mode: String,
     conflate_inputs: Option<bool>,
 ) -> PyResult<(Vec<usize>, Vec<PyRecordBatch>, Vec<PyRecordBatch>)> {
-    compute_changes_with_hash_algorithm(current_state, updates, id_columns, value_columns, system_date, update_mode, None, conflate_inputs)
+    compute_changes_with_hash_algorithm(py, current_state, updates, id_columns, value_columns, system_date, update_mode, None, conflate_inputs)
 }
 
 #[pyfunction]
 fn compute_changes_with_hash_algorithm(
+    py: Python<'_>,
     current_state: PyRecordBatch,
     updates: PyRecordBatch,
     id_columns: Vec<String>,
@@ -1233,8 +1242,9 @@ fn compute_changes_with_hash_algorithm(
     // Parse conflate_inputs parameter (default to false for backward compatibility)
     let conflate = conflate_inputs.unwrap_or(false);
 
-    // Call the process_updates function
-    let changeset = process_updates_with_algorithm(
+    // Call the process_updates function with the GIL released: the inputs are owned
+    // Arrow batches, so other Python threads (e.g. other compute_changes calls) can run
+    let changeset = py.allow_threads(|| process_updates_with_algorithm(
         current_batch,
         updates_batch,
         id_columns,
@@ -1243,7 +1253,7 @@ fn compute_changes_with_hash_algorithm(
         mode,
         algorithm,
         conflate,
-    ).map_err(pyo3::exceptions::PyRuntimeError::new_err)?;
+    )).map_err(pyo3::exceptions::PyRuntimeError::new_err)?;
     
     // Convert the result back to Python types
     let expire_indices = changeset.to_expire;
@@ -1,8 +1,7 @@
 from typing import Tuple, List
-from pandas import to_datetime as pdt
 
 from pytemporal import INFINITY_TIMESTAMP
-from tests.scenarios.defaults import pdt_now, pd_max, pdt_past, BitemporalScenario, pdt_today
+from tests.scenarios.defaults import pdt, pdt_now, pd_max, pdt_past, BitemporalScenario, pdt_today
 
 
 def _insert() -> Tuple[List, List, Tuple]:
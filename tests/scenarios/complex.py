@@ -1,8 +1,7 @@
 from typing import Tuple, List
-from pandas import to_datetime as pdt
 
 from pytemporal import INFINITY_TIMESTAMP
-from tests.scenarios.defaults import pdt_now, pd_max, pdt_past, BitemporalScenario
+from tests.scenarios.defaults import pdt, pdt_now, pd_max, pdt_past, BitemporalScenario
 
 
 def _overlay_two() -> Tuple[List, List, Tuple]:
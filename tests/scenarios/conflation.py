@@ -1,9 +1,8 @@
 from typing import Tuple, List
 
-from pandas import to_datetime as pdt
 from pytemporal import INFINITY_TIMESTAMP
 
-from tests.scenarios.defaults import pdt_now, pd_max, BitemporalScenario
+from tests.scenarios.defaults import pdt, pdt_now, pd_max, BitemporalScenario
 
 
 def _conflation() -> Tuple[List, List, Tuple]:
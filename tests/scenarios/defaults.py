@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Tuple, List, Callable, Literal
 
 import pandas as pd
@@ -9,6 +10,16 @@ pdt_past = pd.Timestamp.now(tz='UTC').tz_localize(None) - pd.Timedelta(hours=1)
 pdt_now = pd.Timestamp.now(tz='UTC').tz_localize(None)
 pdt_today = pd.Timestamp(datetime.utcnow().strftime('%Y-%m-%d'))
 
+
+@lru_cache(maxsize=None)
+def pdt(value: str) -> pd.Timestamp:
+    """
+    pandas.to_datetime for scenario date literals, parsed once per distinct string
+    (Timestamps are immutable, so the cached objects are safe to share)
+    """
+    return pd.to_datetime(value)
+
+
 default_id_columns = ["id", "field"]
 default_value_columns = ["mv", "price"]
 default_columns = (default_id_columns +
@@ -16,7 +27,7 @@ default_columns = (default_id_columns +
                    ["effective_from", "effective_to", "as_of_from", "as_of_to"])
 
 
-@dataclass
+@dataclass(frozen=True)
 class BitemporalScenario:
 
     id: str
@@ -3,6 +3,7 @@ from typing import List, Tuple, Literal
 
 from pandas._testing import assert_frame_equal
 import pandas as pd
+import pyarrow as pa
 
 import pytest
 
@@ -1209,3 +1210,156 @@ def test_bounded_to_open_ended_extension_same_values():
     # Verify the insert is the open-ended version
     assert inserts.iloc[0]['effective_to'] == INFINITY_TIMESTAMP, \
         f"Expected insert to be open-ended, got effective_to={inserts.iloc[0]['effective_to']}"
+
+
+def _single_value_change() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    One open-ended current row for id 1 and an update changing its value from 2024-06-01
+    (fresh frames on every call)
+    """
+    current_state = pd.DataFrame([
+        {'id': 1, 'value': 100,
+         'effective_from': pd.Timestamp('2024-01-01'),
+         'effective_to': INFINITY_TIMESTAMP,
+         'as_of_from': pd.Timestamp('2024-01-01'),
+         'as_of_to': INFINITY_TIMESTAMP},
+    ])
+    updates = pd.DataFrame([
+        {'id': 1, 'value': 200,
+         'effective_from': pd.Timestamp('2024-06-01'),
+         'effective_to': INFINITY_TIMESTAMP,
+         'as_of_from': pd.Timestamp('2024-06-01'),
+         'as_of_to': INFINITY_TIMESTAMP},
+    ])
+    return current_state, updates
+
+
+def test_arrow_inputs_match_dataframe_inputs():
+    """
+    Test: compute_changes accepts pyarrow Tables/RecordBatches directly and
+    produces the same changes as the equivalent DataFrames.
+    """
+    processor = BitemporalTimeseriesProcessor(id_columns=['id'], value_columns=['value'])
+
+    current_state, updates = _single_value_change()
+
+    df_expiries, df_inserts = processor.compute_changes(
+        current_state, updates, system_date='2024-06-01'
+    )
+    arrow_expiries, arrow_inserts = processor.compute_changes(
+        pa.Table.from_pandas(current_state, preserve_index=False),
+        pa.RecordBatch.from_pandas(updates, preserve_index=False),
+        system_date='2024-06-01'
+    )
+
+    # as_of_to on expiries is the processing timestamp, so it differs between calls
+    assert_frame_equal(
+        df_expiries.drop(columns=['as_of_to']),
+        arrow_expiries.drop(columns=['as_of_to']),
+        check_like=True
+    )
+    assert_frame_equal(df_inserts, arrow_inserts, check_like=True)
+
+
+def test_arrow_inputs_with_null_open_ended_periods():
+    """
+    Test: Arrow inputs that encode open-ended periods as nulls (as parquet and
+    Arrow drivers do) give the same changes as DataFrames with NaT.
+    """
+    processor = BitemporalTimeseriesProcessor(id_columns=['id'], value_columns=['value'])
+
+    current_state, updates = _single_value_change()
+    current_state = current_state.assign(effective_to=pd.NaT, as_of_to=pd.NaT)
+    updates = updates.assign(effective_to=pd.NaT, as_of_to=pd.NaT)
+
+    df_expiries, df_inserts = processor.compute_changes(
+        current_state, updates, system_date='2024-06-01'
+    )
+    arrow_expiries, arrow_inserts = processor.compute_changes(
+        pa.Table.from_pandas(current_state, preserve_index=False),
+        pa.Table.from_pandas(updates, preserve_index=False),
+        system_date='2024-06-01'
+    )
+
+    assert len(arrow_expiries) == len(df_expiries) == 1
+    assert_frame_equal(df_inserts, arrow_inserts, check_like=True)
+    # Inserts are sorted by effective_from; the last one is the open-ended update
+    assert arrow_inserts['effective_to'].iloc[-1] == INFINITY_TIMESTAMP
+
+
+def test_pyarrow_dtype_backend():
+    """
+    Test: dtype_backend='pyarrow' returns ArrowDtype-backed frames with the same
+    inserts (including restored infinity) as the default NumPy backend.
+    """
+    current_state, updates = _single_value_change()
+
+    numpy_processor = BitemporalTimeseriesProcessor(id_columns=['id'], value_columns=['value'])
+    arrow_processor = BitemporalTimeseriesProcessor(
+        id_columns=['id'], value_columns=['value'], dtype_backend='pyarrow'
+    )
+
+    _, numpy_inserts = numpy_processor.compute_changes(current_state, updates, system_date='2024-06-01')
+    arrow_expiries, arrow_inserts = arrow_processor.compute_changes(current_state, updates, system_date='2024-06-01')
+
+    assert len(arrow_expiries) == 1
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in arrow_inserts.dtypes)
+    assert len(arrow_inserts) == len(numpy_inserts)
+    assert list(arrow_inserts['effective_from']) == list(numpy_inserts['effective_from'])
+    assert list(arrow_inserts['effective_to']) == list(numpy_inserts['effective_to'])
+    assert list(arrow_inserts['value']) == list(numpy_inserts['value'])
+
+
+@pytest.mark.parametrize("dtype_backend", ["arrow", "pyarrow ", "PyArrow", None])
+def test_invalid_dtype_backend_rejected(dtype_backend):
+    """
+    Test: an unrecognised dtype_backend raises instead of silently using NumPy.
+    """
+    with pytest.raises(ValueError, match="dtype_backend must be 'numpy' or 'pyarrow'"):
+        BitemporalTimeseriesProcessor(id_columns=['id'], value_columns=['value'], dtype_backend=dtype_backend)
+
+
+def test_prepared_current_state_with_dataframe_updates():
+    """
+    Test: a current state prepared once with prepare_arrow can be passed to
+    compute_changes alongside DataFrame updates and gives the same changes.
+    """
+    processor = BitemporalTimeseriesProcessor(id_columns=['id'], value_columns=['value'])
+
+    current_state, updates = _single_value_change()
+
+    df_expiries, df_inserts = processor.compute_changes(
+        current_state, updates, system_date='2024-06-01'
+    )
+    prepared_current = processor.prepare_arrow(current_state)
+    mixed_expiries, mixed_inserts = processor.compute_changes(
+        prepared_current, updates, system_date='2024-06-01'
+    )
+
+    assert len(mixed_expiries) == len(df_expiries) == 1
+    assert_frame_equal(
+        df_inserts.drop(columns=['value_hash']),
+        mixed_inserts.drop(columns=['value_hash']),
+        check_like=True
+    )
+
+
+def test_arrow_current_state_with_nulls_and_dataframe_updates():
+    """
+    Test: an Arrow current state with null open-ended periods, paired with
+    DataFrame updates, is treated the same as NaT in a DataFrame.
+    """
+    processor = BitemporalTimeseriesProcessor(id_columns=['id'], value_columns=['value'])
+
+    current_state, updates = _single_value_change()
+    current_state = current_state.assign(effective_to=pd.NaT, as_of_to=pd.NaT)
+
+    df_expiries, df_inserts = processor.compute_changes(
+        current_state, updates, system_date='2024-06-01'
+    )
+    mixed_expiries, mixed_inserts = processor.compute_changes(
+        pa.Table.from_pandas(current_state, preserve_index=False), updates, system_date='2024-06-01'
+    )
+
+    assert len(mixed_expiries) == len(df_expiries) == 1
+    assert_frame_equal(df_inserts, mixed_inserts, check_like=True)
@@ -94,6 +94,73 @@ class TestSchemaAlignment:
         )
         assert not insert.empty
 
+    def test_categorical_id_column(self):
+        """Test that categorical (dictionary-encoded) columns match plain string columns."""
+        columns = ['id', 'value', 'effective_from', 'effective_to', 'as_of_from', 'as_of_to']
+        current_state = self._make_df(columns, [
+            ['a', 100, '2024-01-01', '2024-12-31', '2024-01-01', INFINITY_TIMESTAMP]
+        ])
+        updates = self._make_df(columns, [
+            ['a', 200, '2024-06-01', '2024-12-31', '2024-01-15', INFINITY_TIMESTAMP]
+        ])
+
+        expire1, insert1 = self.processor.compute_changes(
+            current_state, updates, system_date=self.system_date
+        )
+        expire2, insert2 = self.processor.compute_changes(
+            current_state.astype({'id': 'category'}),
+            updates.astype({'id': 'category'}),
+            system_date=self.system_date
+        )
+
+        assert len(expire1) == len(expire2) == 1
+        pd.testing.assert_frame_equal(insert1, insert2)
+
+    def test_schema_cache_reused_for_typed_columns(self):
+        """Test that a repeated all-typed column layout reuses the cached Arrow schema."""
+        columns = ['id', 'value', 'effective_from', 'effective_to', 'as_of_from', 'as_of_to']
+        current_state = self._make_df(columns, [
+            [1, 100, '2024-01-01', '2024-12-31', '2024-01-01', INFINITY_TIMESTAMP]
+        ])
+        updates = self._make_df(columns, [
+            [1, 200, '2024-06-01', '2024-12-31', '2024-01-15', INFINITY_TIMESTAMP]
+        ])
+
+        expire1, insert1 = self.processor.compute_changes(current_state, updates, system_date=self.system_date)
+        cached = dict(self.processor._schema_cache)
+        # Both frames share one layout (the value_hash placeholder is not object dtype)
+        assert len(cached) == 1
+
+        expire2, insert2 = self.processor.compute_changes(current_state, updates, system_date=self.system_date)
+
+        # A miss would have stored a freshly inferred schema object for the layout
+        assert self.processor._schema_cache.keys() == cached.keys()
+        assert all(self.processor._schema_cache[key] is schema for key, schema in cached.items())
+        assert len(expire1) == len(expire2) == 1
+        pd.testing.assert_frame_equal(insert1, insert2)
+
+    def test_object_columns_bypass_schema_cache(self):
+        """Test that frames with object columns are re-inferred each call instead of cached."""
+        columns = ['id', 'value', 'note', 'effective_from', 'effective_to', 'as_of_from', 'as_of_to']
+        current_state = self._make_df(columns, [
+            [1, 100, 'a', '2024-01-01', '2024-12-31', '2024-01-01', INFINITY_TIMESTAMP]
+        ])
+        updates = self._make_df(columns, [
+            [1, 200, 'b', '2024-06-01', '2024-12-31', '2024-01-15', INFINITY_TIMESTAMP]
+        ])
+        self.processor.compute_changes(current_state, updates, system_date=self.system_date)
+        assert not self.processor._schema_cache
+
+        # Same column/dtype layout (note is still object dtype) but different Python types
+        current_state['note'] = pd.Series([1.5], dtype=object)
+        updates['note'] = pd.Series([2.5], dtype=object)
+        expire, insert = self.processor.compute_changes(
+            current_state, updates, system_date=self.system_date
+        )
+        assert not insert.empty
+        assert 2.5 in insert['note'].tolist()
+        assert not self.processor._schema_cache
+
     def test_reordered_columns_produce_correct_results(self):
         """Test that reordered columns produce identical results."""
         processor = BitemporalTimeseriesProcessor(
@@ -309,8 +309,8 @@ class TestTimezoneHandling:
             assert normalized_current[col].dt.tz == normalized_updates[col].dt.tz, f"Timezone mismatch in {col}"
         
         # 3. Convert to Arrow RecordBatches
-        current_batch = pa.RecordBatch.from_pandas(normalized_current)
-        updates_batch = pa.RecordBatch.from_pandas(normalized_updates)
+        current_batch = pa.RecordBatch.from_pandas(normalized_current, preserve_index=False)
+        updates_batch = pa.RecordBatch.from_pandas(normalized_updates, preserve_index=False)
         
         # 4. Convert timestamps to microseconds (Rust-compatible)
         current_batch_us = processor._convert_timestamps_to_microseconds(current_batch)